@@ -0,0 +1,111 @@
+"""
+Regression checks for configuration loading and natural language time parsing.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+import yaml
+
+from vassis import AssistantConfig, format_relative, parse, parse_duration
+
+# Thursday
+REFERENCE = datetime(2026, 10, 15, 10, 30)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("today at 5pm", datetime(2026, 10, 15, 17, 0)),
+    ("tomorrow at 3pm", datetime(2026, 10, 16, 15, 0)),
+    ("at 9am tomorrow", datetime(2026, 10, 16, 9, 0)),
+    ("tomorrow", datetime(2026, 10, 16, 10, 30)),
+    ("monday 9am", datetime(2026, 10, 19, 9, 0)),
+    ("friday at 3pm", datetime(2026, 10, 16, 15, 0)),
+    ("3pm on friday", datetime(2026, 10, 16, 15, 0)),
+    ("on friday at 3pm", datetime(2026, 10, 16, 15, 0)),
+    ("on friday", datetime(2026, 10, 16, 10, 30)),
+    ("thursday", datetime(2026, 10, 15, 10, 30)),
+    ("next thursday", datetime(2026, 10, 22, 10, 30)),
+])
+def test_parse_day_reference_with_clock_time(text, expected):
+    assert parse(text, REFERENCE) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("3pm", datetime(2026, 10, 15, 15, 0)),
+    ("at 3pm", datetime(2026, 10, 15, 15, 0)),
+    ("at 14:30", datetime(2026, 10, 15, 14, 30)),
+])
+def test_parse_clock_time(text, expected):
+    assert parse(text, REFERENCE) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("in 2 hours", datetime(2026, 10, 15, 12, 30)),
+    ("in 5 mins", datetime(2026, 10, 15, 10, 35)),
+    ("in 2 hrs", datetime(2026, 10, 15, 12, 30)),
+    ("in 1 hour 30 minutes", datetime(2026, 10, 15, 12, 0)),
+    ("in 3 weeks", datetime(2026, 11, 5, 10, 30)),
+])
+def test_parse_relative_time(text, expected):
+    assert parse(text, REFERENCE) == expected
+
+
+@pytest.mark.parametrize("text, expected_date", [
+    ("friday december 25 2026", date(2026, 12, 25)),
+    ("monday, october 26", date(2026, 10, 26)),
+    ("at 3pm on december 25", date(2026, 12, 25)),
+])
+def test_parse_keeps_explicit_dates(text, expected_date):
+    assert parse(text, REFERENCE).date() == expected_date
+
+
+def test_parse_duration_sums_repeated_units():
+    assert parse_duration("2 hours 30 minutes") == timedelta(hours=2, minutes=30)
+    assert parse_duration("3 hrs and 2 hrs") == timedelta(hours=5)
+    assert parse_duration("nothing") is None
+
+
+@pytest.mark.parametrize("offset, expected", [
+    (timedelta(seconds=-1), "in the past"),
+    (timedelta(seconds=5), "in a few seconds"),
+    (timedelta(minutes=1), "in 1 minute"),
+    (timedelta(minutes=59, seconds=59), "in 59 minutes"),
+    (timedelta(hours=1), "in 1 hour"),
+    (timedelta(hours=5), "in 5 hours"),
+    (timedelta(days=1), "in 1 day"),
+    (timedelta(days=3, hours=2), "in 3 days"),
+])
+def test_format_relative_buckets(offset, expected):
+    assert format_relative(REFERENCE + offset, now=REFERENCE) == expected
+
+
+def test_format_relative_defaults_to_current_time():
+    assert format_relative(datetime.now() + timedelta(hours=2, minutes=1)) == "in 2 hours"
+
+
+def test_save_to_file_writes_all_fields_except_api_keys(tmp_path):
+    path = tmp_path / "config.yaml"
+    AssistantConfig(min_feedback_count=5, weather_api_key="secret").save_to_file(str(path))
+
+    saved = yaml.safe_load(path.read_text())
+    assert saved["min_feedback_count"] == 5
+    assert "weather_api_key" not in saved
+    assert "search_api_key" not in saved
+
+
+def test_load_from_file_returns_independent_copies(tmp_path):
+    path = tmp_path / "config.yaml"
+    AssistantConfig(name="First").save_to_file(str(path))
+
+    loaded = AssistantConfig.load_from_file(str(path))
+    loaded.name = "Changed"
+    assert AssistantConfig.load_from_file(str(path)).name == "First"
+
+
+def test_load_from_file_rereads_changed_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    AssistantConfig(name="First").save_to_file(str(path))
+    assert AssistantConfig.load_from_file(str(path)).name == "First"
+
+    AssistantConfig(name="Second version").save_to_file(str(path))
+    assert AssistantConfig.load_from_file(str(path)).name == "Second version"
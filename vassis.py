@@ -3,14 +3,31 @@ Configuration management for the Virtual Assistant.
 Provides centralized configuration with environment variable support.
 """
 
+import functools
 import os
-from pathlib import Path
+import threading
 from typing import Any, Dict, Optional
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 import yaml
 
+# Prefer the libyaml-backed loader/dumper when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-@dataclass
+
+@functools.lru_cache(maxsize=None)
+def _env(key: str) -> str:
+    """Read an environment variable once; the process environment is fixed."""
+    return os.environ.get(key, '')
+
+
+# Parsed config values keyed by (path, mtime, size); FIFO-evicted past the limit
+_PARSE_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_PARSE_CACHE_SIZE = 8
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
 class AssistantConfig:
     """Main configuration class for the virtual assistant."""
     
@@ -40,45 +57,48 @@ class AssistantConfig:
     enable_reminders: bool = True
     enable_calendar: bool = True
     enable_weather: bool = True
-    enable_learning: bool = True
     
     @classmethod
     def load_from_file(cls, config_path: str = "config.yaml") -> "AssistantConfig":
         """Load configuration from YAML file."""
-        if not Path(config_path).exists():
+        try:
+            f = open(config_path, 'rb')
+        except FileNotFoundError:
             return cls()
-        
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f) or {}
+
+        with f:
+            st = os.fstat(f.fileno())
+            key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+            with _PARSE_CACHE_LOCK:
+                cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                return cls(**cached)
+            config_data = yaml.load(f, Loader=_YAML_LOADER) or {}
         
         # Apply environment variable overrides
         env_overrides = {
-            'weather_api_key': os.environ.get('WEATHER_API_KEY', ''),
-            'search_api_key': os.environ.get('SEARCH_API_KEY', ''),
+            'weather_api_key': _env('WEATHER_API_KEY'),
+            'search_api_key': _env('SEARCH_API_KEY'),
         }
         config_data.update({k: v for k, v in env_overrides.items() if v})
         
-        return cls(**config_data)
+        loaded = cls(**config_data)
+        with _PARSE_CACHE_LOCK:
+            if key not in _PARSE_CACHE and len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+                del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+            _PARSE_CACHE[key] = config_data
+        return loaded
     
     def save_to_file(self, config_path: str = "config.yaml"):
         """Save current configuration to YAML file."""
-        config_dict = {
-            'name': self.name,
-            'voice_name': self.voice_name,
-            'language': self.language,
-            'use_voice': self.use_voice,
-            'use_gpu': self.use_gpu,
-            'confidence_threshold': self.confidence_threshold,
-            'enable_learning': self.enable_learning,
-            'data_dir': self.data_dir,
-            'models_dir': self.models_dir,
-            'enable_reminders': self.enable_reminders,
-            'enable_calendar': self.enable_calendar,
-            'enable_weather': self.enable_weather,
-        }
+        config_dict = asdict(self)
+        
+        # API keys come from the environment and are never written to disk
+        config_dict.pop('weather_api_key', None)
+        config_dict.pop('search_api_key', None)
         
         with open(config_path, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False)
+            yaml.dump(config_dict, f, Dumper=_YAML_DUMPER, default_flow_style=False)
 
 
 class ConfigManager:
@@ -89,16 +109,20 @@ class ConfigManager:
     
     _instance: Optional["ConfigManager"] = None
     _config: Optional[AssistantConfig] = None
+    _initialized: bool = False
+    _lock = threading.Lock()
     
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+        if not cls._initialized:
+            with cls._lock:
+                # Re-check under the lock so racing threads load only once
+                if not cls._initialized:
+                    instance = super().__new__(cls)
+                    instance._config = AssistantConfig.load_from_file()
+                    cls._instance = instance
+                    cls._initialized = True
         return cls._instance
     
-    def __init__(self):
-        if self._config is None:
-            self._config = AssistantConfig.load_from_file()
-    
     @property
     def config(self) -> AssistantConfig:
         return self._config
@@ -109,8 +133,9 @@ class ConfigManager:
     
     def update(self, **kwargs):
         """Update configuration values."""
+        fields = self._config.__dataclass_fields__
         for key, value in kwargs.items():
-            if hasattr(self._config, key):
+            if key in fields:
                 setattr(self._config, key, value)
 
 
@@ -122,25 +147,294 @@ Handles natural language time expressions like "tomorrow at 3pm".
 """
 
 from datetime import datetime, timedelta
+import functools
 from typing import Optional, Tuple
-from dateutil import parser
-from dateutil.relativedelta import relativedelta
 import re
 
+# dateutil is imported on first use in parse() to keep module import cheap
+_DATEUTIL_PARSER = None
+
+# Compiled patterns used by parse() and parse_duration()
+_REL_PATTERNS = [
+    (re.compile(r'in (\d+) (?:minutes?|mins?)'), lambda m: timedelta(minutes=int(m.group(1)))),
+    (re.compile(r'in (\d+) (?:hours?|hrs?)'), lambda m: timedelta(hours=int(m.group(1)))),
+    (re.compile(r'in (\d+) days?'), lambda m: timedelta(days=int(m.group(1)))),
+    (re.compile(r'in (\d+) weeks?'), lambda m: timedelta(weeks=int(m.group(1)))),
+]
+
+# Day references: literal offsets plus weekday names
+_DAY_OFFSETS = {
+    'today': timedelta(0),
+    'tomorrow': timedelta(days=1),
+    'yesterday': timedelta(days=-1),
+}
+_DAY_RE = re.compile(r'\b(today|tomorrow|yesterday|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b')
+
+# Words that may accompany a day reference without changing its meaning
+_FILLER_WORDS = frozenset({'on', 'at', 'next'})
+
+_CLOCK_PATTERNS = [
+    re.compile(r'(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<ampm>am|pm)?'),
+    re.compile(r'(?P<hour>\d{1,2})\s*(?P<ampm>am|pm)'),
+]
+
+# Unit words that mark a relative expression; only inputs containing one of
+# them are searched with _REL_PATTERNS once dateutil has failed
+_FAST_KEYWORDS = frozenset({
+    'minute', 'minutes', 'min', 'mins', 'hour', 'hours', 'hr', 'hrs',
+    'day', 'days', 'week', 'weeks',
+})
+
+_DOW = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+# Single-pass duration scan; units are keyed by their first letter
+_DURATION_UNIT_NAMES = r'weeks?|days?|hours?|hrs?|minutes?|mins?|seconds?|secs?'
+_DURATION_RE = re.compile(rf'(?P<n>\d+)\s*(?P<u>{_DURATION_UNIT_NAMES})')
+_DURATION_UNITS = {
+    'w': timedelta(weeks=1),
+    'h': timedelta(hours=1),
+    'm': timedelta(minutes=1),
+    's': timedelta(seconds=1),
+    'd': timedelta(days=1),
+}
+
+# A whole duration such as "1 hour 30 minutes" or "2 days, 3 hours and 5 mins"
+_DURATION_SPAN_RE = re.compile(
+    rf'\d+\s*(?:{_DURATION_UNIT_NAMES})(?:(?:\s*,\s*|\s+and\s+|\s+)\d+\s*(?:{_DURATION_UNIT_NAMES}))*'
+)
+
+
+_UNIT_MAP = {
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+}
+_ZERO_DELTA = timedelta(0)
+
+
+def _relative_delta(time_unit: str) -> timedelta:
+    """Convert relative time unit to timedelta."""
+    return _UNIT_MAP.get(time_unit, _ZERO_DELTA)
+
+
+def _match_relative(time_string: str, reference_time: datetime) -> Optional[datetime]:
+    """Match an "in <duration>" expression that makes up the whole input."""
+    if time_string.startswith('in '):
+        duration_string = time_string[3:].lstrip()
+        if _DURATION_SPAN_RE.fullmatch(duration_string):
+            return reference_time + parse_duration(duration_string)
+    return None
+
+
+def _search_relative(time_string: str, reference_time: datetime) -> Optional[datetime]:
+    """Find "in N minutes/hours/days/weeks" anywhere in the input."""
+    for pattern, delta_func in _REL_PATTERNS:
+        match = pattern.search(time_string)
+        if match:
+            return reference_time + delta_func(match)
+    return None
+
+
+def _apply_clock(match: re.Match, reference_time: datetime) -> Optional[datetime]:
+    """Set the time of day from a _CLOCK_PATTERNS match."""
+    try:
+        hour = int(match.group('hour'))
+        minute = int(match.groupdict().get('minute') or 0)
+        ampm = match.group('ampm')
+        
+        if ampm:
+            if ampm == 'pm' and hour != 12:
+                hour += 12
+            elif ampm == 'am' and hour == 12:
+                hour = 0
+        
+        return reference_time.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    except ValueError:
+        return None
+
+
+def _match_clock(time_string: str, reference_time: datetime) -> Optional[datetime]:
+    """Match input that is only a clock time ("3pm", "at 2:30 am")."""
+    if time_string.startswith('at '):
+        time_string = time_string[3:].lstrip()
+    for pattern in _CLOCK_PATTERNS:
+        match = pattern.fullmatch(time_string)
+        if match:
+            return _apply_clock(match, reference_time)
+    return None
+
+
+def _search_clock(time_string: str, reference_time: datetime) -> Optional[datetime]:
+    """Find a clock time such as "3pm" or "2:30 am" anywhere in the input."""
+    for pattern in _CLOCK_PATTERNS:
+        match = pattern.search(time_string)
+        if match:
+            parsed = _apply_clock(match, reference_time)
+            if parsed is not None:
+                return parsed
+    return None
+
+
+def _shift_day(day: str, reference_time: datetime, skip_today: bool = False) -> datetime:
+    """Move reference_time to a day reference; weekdays resolve to the next occurrence."""
+    offset = _DAY_OFFSETS.get(day)
+    if offset is not None:
+        return reference_time + offset
+    days_ahead = (_DOW[day] - reference_time.weekday()) % 7
+    if days_ahead == 0 and skip_today:
+        days_ahead = 7
+    return reference_time + timedelta(days=days_ahead)
+
+
+def _match_day(time_string: str, reference_time: datetime) -> Optional[datetime]:
+    """
+    Match a day reference ("tomorrow", "on friday at 3pm") when the rest of
+    the input is at most a clock time and filler words.
+    """
+    match = _DAY_RE.search(time_string)
+    if match is None:
+        return None
+    
+    rest = f"{time_string[:match.start()]} {time_string[match.end():]}".replace(',', ' ').split()
+    base = _shift_day(match.group(1), reference_time, skip_today='next' in rest)
+    words = [word for word in rest if word not in _FILLER_WORDS]
+    if not words:
+        return base
+    return _match_clock(' '.join(words), base)
+
+
+# Cheap dispatch on the leading word so common forms need only one matcher;
+# "on <weekday>" is covered by the day-reference step that runs first.
+# Matchers only succeed when they account for the whole input.
+_PREFIX_MATCHERS = {
+    'in ': _match_relative,
+    'at ': _match_clock,
+}
+
+
+def parse(time_string: str, reference_time: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Parse a natural language time expression.
+    
+    Args:
+        time_string: Natural language time expression
+        reference_time: Reference time for relative calculations (defaults to now)
+        
+    Returns:
+        Parsed datetime or None if parsing fails
+    """
+    global _DATEUTIL_PARSER
+    
+    if reference_time is None:
+        reference_time = datetime.now()
+    
+    time_string = time_string.lower().strip()
+    
+    # A day reference shifts the base date; a clock time, if any, applies on top
+    parsed = _match_day(time_string, reference_time)
+    if parsed is not None:
+        return parsed
+    
+    # A bare clock time ("3pm", "14:30") resolves the same way as "at 3pm"
+    matcher = _PREFIX_MATCHERS.get(time_string[:3], _match_clock)
+    parsed = matcher(time_string, reference_time)
+    if parsed is not None:
+        return parsed
+    
+    # Try direct dateutil parsing
+    if _DATEUTIL_PARSER is None:
+        from dateutil import parser
+        _DATEUTIL_PARSER = parser
+    try:
+        parsed = _DATEUTIL_PARSER.parse(time_string, fuzzy=True, default=reference_time)
+        if parsed > reference_time or parsed.date() >= reference_time.date():
+            return parsed
+    except (ValueError, TypeError):
+        pass
+    
+    # Fall back to a relative, day or clock expression anywhere in the input
+    if not _FAST_KEYWORDS.isdisjoint(time_string.split()):
+        parsed = _search_relative(time_string, reference_time)
+        if parsed is not None:
+            return parsed
+    
+    match = _DAY_RE.search(time_string)
+    if match:
+        base = _shift_day(match.group(1), reference_time)
+        return _search_clock(time_string, base) or base
+    
+    return _search_clock(time_string, reference_time)
+
+
+def parse_duration(duration_string: str) -> Optional[timedelta]:
+    """
+    Parse a duration string into a timedelta.
+    
+    Args:
+        duration_string: Duration in natural language (e.g., "2 hours 30 minutes")
+        
+    Returns:
+        timedelta or None if parsing fails
+    """
+    duration_string = duration_string.lower()
+    total_delta = timedelta(0)
+    
+    for match in _DURATION_RE.finditer(duration_string):
+        total_delta += _DURATION_UNITS[match.group('u')[0]] * int(match.group('n'))
+    
+    return total_delta if total_delta != timedelta(0) else None
+
+
+def format_relative(dt: datetime, now: Optional[datetime] = None) -> str:
+    """
+    Format a datetime as a relative time string.
+    
+    Args:
+        dt: Datetime to describe
+        now: Reference time (defaults to now); pass it in when formatting
+            many datetimes at once to avoid a clock read per item
+    """
+    if now is None:
+        now = datetime.now()
+    return _format_relative_seconds((dt - now) // timedelta(seconds=1))
+
+
+@functools.lru_cache(maxsize=512)
+def _format_relative_seconds(seconds: int) -> str:
+    """Format a whole-second offset from now; memoized per second."""
+    if seconds < 0:
+        return "in the past"
+    
+    if seconds < 60:
+        return "in a few seconds"
+    if seconds < 3600:
+        minutes = seconds // 60
+        return f"in {minutes} minute{'s' if minutes != 1 else ''}"
+    if seconds < 86400:
+        hours = seconds // 3600
+        return f"in {hours} hour{'s' if hours != 1 else ''}"
+    
+    days = seconds // 86400
+    return f"in {days} day{'s' if days != 1 else ''}"
+
 
 class TimeParser:
     """
-    Parses natural language time expressions into datetime objects.
-    Supports various formats including relative and absolute times.
+    Backwards-compatible namespace for the module-level time parsing functions.
+    New code should call parse(), parse_duration() and format_relative() directly.
     """
     
-    # Patterns for common time expressions
+    # Kept for backwards compatibility only; parse() does not use these
     TIME_PATTERNS = [
         # Relative times
         (r'in (\d+) (minutes?|mins?)', lambda m: timedelta(minutes=int(m.group(1)))),
         (r'in (\d+) (hours?|hrs?)', lambda m: timedelta(hours=int(m.group(1)))),
         (r'in (\d+) (days?)', lambda m: timedelta(days=int(m.group(1)))),
-        (r'in a (minute|hour|day)', lambda m: self._relative_delta(m.group(1))),
+        (r'in a (minute|hour|day)', lambda m: _relative_delta(m.group(1))),
         
         # Daily times
         (r'at (\d{1,2}):(\d{2})\s*(am|pm)?', None),
@@ -155,147 +449,7 @@ class TimeParser:
         (r'on (monday|tuesday|wednesday|thursday|friday|saturday|sunday)', None),
     ]
     
-    @staticmethod
-    def _relative_delta(time_unit: str) -> timedelta:
-        """Convert relative time unit to timedelta."""
-        unit_map = {
-            'minute': timedelta(minutes=1),
-            'hour': timedelta(hours=1),
-            'day': timedelta(days=1),
-            'week': timedelta(weeks=1),
-        }
-        return unit_map.get(time_unit, timedelta(0))
-    
-    @classmethod
-    def parse(cls, time_string: str, reference_time: Optional[datetime] = None) -> Optional[datetime]:
-        """
-        Parse a natural language time expression.
-        
-        Args:
-            time_string: Natural language time expression
-            reference_time: Reference time for relative calculations (defaults to now)
-            
-        Returns:
-            Parsed datetime or None if parsing fails
-        """
-        if reference_time is None:
-            reference_time = datetime.now()
-        
-        time_string = time_string.lower().strip()
-        
-        # Try direct dateutil parsing first
-        try:
-            parsed = parser.parse(time_string, fuzzy=True, default=reference_time)
-            if parsed > reference_time or parsed.date() >= reference_time.date():
-                return parsed
-        except (ValueError, TypeError):
-            pass
-        
-        # Try pattern-based parsing
-        parsed_time = reference_time
-        
-        # Handle relative patterns
-        relative_patterns = [
-            (r'in (\d+) minutes?', timedelta(minutes=int)),
-            (r'in (\d+) hours?', timedelta(hours=int)),
-            (r'in (\d+) days?', timedelta(days=int)),
-            (r'in (\d+) weeks?', timedelta(weeks=int)),
-            (r'tomorrow', lambda: timedelta(days=1)),
-            (r'today', lambda: timedelta(0)),
-        ]
-        
-        for pattern, delta_func in relative_patterns:
-            match = re.search(pattern, time_string)
-            if match:
-                if callable(delta_func):
-                    delta = delta_func()
-                else:
-                    delta = delta_func(match)
-                parsed_time += delta
-                return parsed_time
-        
-        # Handle time patterns (e.g., "3pm", "2:30 am")
-        time_patterns = [
-            (r'(\d{1,2}):(\d{2})\s*(am|pm)?', None),
-            (r'(\d{1,2})\s*(am|pm)', None),
-        ]
-        
-        for pattern, _ in time_patterns:
-            match = re.search(pattern, time_string)
-            if match:
-                try:
-                    hour = int(match.group(1))
-                    minute = int(match.group(2)) if len(match.groups()) > 1 else 0
-                    ampm = match.group(3) if len(match.groups()) > 2 else None
-                    
-                    if ampm:
-                        if ampm.lower() == 'pm' and hour != 12:
-                            hour += 12
-                        elif ampm.lower() == 'am' and hour == 12:
-                            hour = 0
-                    
-                    parsed_time = parsed_time.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    return parsed_time
-                except ValueError:
-                    continue
-        
-        # Handle day of week
-        days_of_week = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        
-        for day_name, day_num in days_of_week.items():
-            if day_name in time_string:
-                current_weekday = reference_time.weekday()
-                days_ahead = day_num - current_weekday
-                if days_ahead <= 0:
-                    days_ahead += 7
-                parsed_time += timedelta(days=days_ahead)
-                return parsed_time
-        
-        return None
-    
-    @classmethod
-    def parse_duration(cls, duration_string: str) -> Optional[timedelta]:
-        """
-        Parse a duration string into a timedelta.
-        
-        Args:
-            duration_string: Duration in natural language (e.g., "2 hours 30 minutes")
-            
-        Returns:
-            timedelta or None if parsing fails
-        """
-        duration_string = duration_string.lower()
-        total_delta = timedelta(0)
-        
-        patterns = [
-            (r'(\d+)\s*(?:hours?|hrs?)', lambda m: timedelta(hours=int(m.group(1)))),
-            (r'(\d+)\s*(?:minutes?|mins?)', lambda m: timedelta(minutes=int(m.group(1)))),
-            (r'(\d+)\s*(?:seconds?|secs?)', lambda m: timedelta(seconds=int(m.group(1)))),
-            (r'(\d+)\s*(?:days?)', lambda m: timedelta(days=int(m.group(1)))),
-        ]
-        
-        for pattern, delta_func in patterns:
-            match = re.search(pattern, duration_string)
-            if match:
-                total_delta += delta_func(match)
-        
-        return total_delta if total_delta != timedelta(0) else None
-    
-    @staticmethod
-    def format_relative(dt: datetime) -> str:
-        """Format a datetime as a relative time string."""
-        now = datetime.now()
-        diff = dt - now
-        
-        if diff.total_seconds() < 0:
-            return "in the past"
-        
-        seconds = diff.total_seconds()
-        
-        if seconds < 60:
-            return "in a few seconds"
-        if seconds < 3600:
-            minutes
\ No newline at end of file
+    parse = staticmethod(parse)
+    parse_duration = staticmethod(parse_duration)
+    format_relative = staticmethod(format_relative)
+    _relative_delta = staticmethod(_relative_delta)